@@ -54,6 +54,8 @@ USER_EMAIL=""
 SANITIZED_NAME=""
 USER_ID=""
 PRODUCT_ID=""
+STATUS_DAEMON_PID=""
+STATUS_EMITTER_PID=""
 
 # Logging functions
 log() {
@@ -133,17 +135,53 @@ parse_arguments() {
     log_info "Configuration parsed successfully"
 }
 
+# Start the long-lived DynamoDB status updater used by update-job-status.py
+start_status_daemon() {
+    export STATUS_DAEMON_SOCKET="/tmp/status-daemon.sock"
+    
+    python3 "$SCRIPT_DIR/status-daemon.py" &
+    STATUS_DAEMON_PID=$!
+    log_info "Status daemon started (PID $STATUS_DAEMON_PID)"
+}
+
+# Start the async emitter that batches fire-and-forget progress updates
+start_status_emitter() {
+    export STATUS_FIFO="/tmp/status.fifo"
+    
+    # Create the FIFO up front and hold it open read-write on fd 3, so
+    # updates queued before the emitter is ready are buffered in the pipe
+    # and writers never block waiting for a reader
+    rm -f "$STATUS_FIFO"
+    mkfifo "$STATUS_FIFO"
+    exec 3<>"$STATUS_FIFO"
+    
+    python3 "$SCRIPT_DIR/status-emitter.py" --job-id "$JOB_ID" --fifo "$STATUS_FIFO" &
+    export STATUS_EMITTER_PID=$!
+    log_info "Status emitter started (PID $STATUS_EMITTER_PID)"
+}
+
+# Stop the status emitter, waiting for it to flush queued updates
+stop_status_emitter() {
+    if [ -n "$STATUS_EMITTER_PID" ]; then
+        kill -TERM "$STATUS_EMITTER_PID" 2>/dev/null || true
+        wait "$STATUS_EMITTER_PID" 2>/dev/null || true
+        STATUS_EMITTER_PID=""
+        
+        exec 3>&-
+        rm -f "$STATUS_FIFO"
+    fi
+}
+
+# Status helpers (emit_status)
+source "$SCRIPT_DIR/status-lib.sh"
+
 # Fetch job data from DynamoDB
 fetch_job_data() {
     CURRENT_STAGE="$STAGE_FETCH_DATA"
     log_info "Fetching job data from DynamoDB"
     
     # Update status to IN_PROGRESS
-    python3 "$SCRIPT_DIR/update-job-status.py" \
-        --job-id "$JOB_ID" \
-        --status "IN_PROGRESS" \
-        --step "$CURRENT_STAGE" \
-        --progress 5
+    emit_status "{\"status\":\"IN_PROGRESS\",\"step\":\"$CURRENT_STAGE\",\"progress\":5}"
     
     # Fetch job data
     python3 "$SCRIPT_DIR/fetch-job-data.py" \
@@ -160,10 +198,7 @@ fetch_job_data() {
     fi
     
     # Update progress
-    python3 "$SCRIPT_DIR/update-job-status.py" \
-        --job-id "$JOB_ID" \
-        --step "$CURRENT_STAGE" \
-        --progress 10
+    emit_status "{\"step\":\"$CURRENT_STAGE\",\"progress\":10}"
 }
 
 # Execute pipeline stage
@@ -249,6 +284,9 @@ handle_pipeline_failure() {
     
     log_error "Pipeline failed: $error_message"
     
+    # Flush queued progress updates so they can't land after the failure
+    stop_status_emitter
+    
     # Update job status to failed
     python3 "$SCRIPT_DIR/update-job-status.py" \
         --job-id "$JOB_ID" \
@@ -270,6 +308,14 @@ cleanup_resources() {
         rm -rf "$WORKSPACE_DIR"/* 2>/dev/null || true
     fi
     
+    # Stop the status emitter and daemon
+    stop_status_emitter
+    
+    if [ -n "$STATUS_DAEMON_PID" ]; then
+        kill "$STATUS_DAEMON_PID" 2>/dev/null || true
+        STATUS_DAEMON_PID=""
+    fi
+    
     # Clean up any other temporary resources
     # (Additional cleanup logic can be added here)
     
@@ -282,6 +328,8 @@ main() {
     
     # Parse arguments and fetch job data
     parse_arguments
+    start_status_daemon
+    start_status_emitter
     fetch_job_data
     
     # Export variables for child scripts (after job data is loaded)
@@ -301,6 +349,7 @@ main() {
     export CLAUDE_API_KEY_SECRET
     export GITHUB_USERNAME
     export TEMPLATE_REPO
+    export STATUS_FIFO
     
     # Execute pipeline stages
     execute_stage "$STAGE_CLONE" "clone-template.sh"
@@ -326,6 +375,9 @@ main() {
         staging_url=$(cat "$WORKSPACE_DIR/staging_url.txt")
     fi
     
+    # Flush queued progress updates before the final status is written
+    stop_status_emitter
+    
     # Update final status
     python3 "$SCRIPT_DIR/update-job-status.py" \
         --job-id "$JOB_ID" \
@@ -85,6 +85,9 @@ handle_error() {
 
 trap handle_error ERR
 
+# Status helpers (emit_status)
+source "$(dirname "${BASH_SOURCE[0]}")/status-lib.sh"
+
 # Retry function with exponential backoff
 retry_with_backoff() {
     local cmd="$1"
@@ -151,10 +154,7 @@ clone_template() {
     log_info "Cloning template repository: $TEMPLATE_REPO"
     
     # Update progress
-    python3 /app/scripts/update-job-status.py \
-        --job-id "$JOB_ID" \
-        --step "CREATING_REPO" \
-        --progress 15
+    emit_status '{"step":"CREATING_REPO","progress":15}'
     
     # Remove existing directories if they exist
     rm -rf "$CLONE_DIR" "$PROJECT_DIR"
@@ -243,10 +243,7 @@ create_github_repository() {
     log_info "Creating GitHub repository: $REPO_NAME"
     
     # Update progress
-    python3 /app/scripts/update-job-status.py \
-        --job-id "$JOB_ID" \
-        --step "CREATING_REPO" \
-        --progress 25
+    emit_status '{"step":"CREATING_REPO","progress":25}'
     
     cd "$PROJECT_DIR"
     
@@ -408,10 +405,7 @@ push_to_github() {
     fi
     
     # Update progress
-    python3 /app/scripts/update-job-status.py \
-        --job-id "$JOB_ID" \
-        --step "CREATING_REPO" \
-        --progress 35
+    emit_status '{"step":"CREATING_REPO","progress":35}'
     
     # Push to main branch
     local push_cmd="git push -u origin main"
@@ -447,10 +441,7 @@ main() {
     push_to_github
     
     # Update progress
-    python3 /app/scripts/update-job-status.py \
-        --job-id "$JOB_ID" \
-        --step "CREATING_REPO" \
-        --progress 40
+    emit_status '{"step":"CREATING_REPO","progress":40}'
     
     log_info "Template cloning and repository creation completed successfully"
     log_info "Project directory: $PROJECT_DIR"
@@ -1,19 +1,50 @@
 #!/usr/bin/env python3
-import boto3
-import json
+import orjson
 import argparse
 import os
+import shlex
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from decimal import Decimal
+from job_status import update_job_status
+
+def decimal_default(obj):
+    """Serialize DynamoDB numbers (Decimal) as JSON numbers, anything else as a string"""
+    if isinstance(obj, Decimal):
+        # orjson only encodes integers within the int64/uint64 range
+        if obj == obj.to_integral_value() and -2**63 <= obj < 2**64:
+            return int(obj)
+        return float(obj)
+    return str(obj)
+
+def write_file(path, content, mode=0o644):
+    """Write bytes to a file with a raw os.write, skipping Python's buffered IO"""
+    
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 def fetch_job_data(job_id, output_dir):
-    """Fetch complete job data from DynamoDB"""
+    """Fetch job data from DynamoDB"""
     
-    dynamodb = boto3.resource('dynamodb')
-    table = dynamodb.Table(os.environ['DYNAMODB_TABLE'])
+    table = update_job_status.get_table()
     
     try:
-        # Get job record
-        response = table.get_item(Key={'jobId': job_id})
+        # Get job record, fetching only the attributes used below, while the
+        # output directory is created alongside the DynamoDB round-trip
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            item_future = executor.submit(
+                table.get_item,
+                Key={'jobId': job_id},
+                ProjectionExpression='jobId, businessName, userId, productId'
+            )
+            mkdir_future = executor.submit(os.makedirs, output_dir, exist_ok=True)
+            response = item_future.result()
+            mkdir_future.result()
         
         if 'Item' not in response:
             raise Exception(f"Job {job_id} not found in DynamoDB")
@@ -84,30 +115,35 @@ Build a modern MVP web application for {business_name} using best practices and
 4. Basic documentation
 """
         
-        # Write files for Claude Code
-        os.makedirs(output_dir, exist_ok=True)
+        # job-data.json holds only the projected attributes (jobId, businessName,
+        # userId, productId); decimal_default covers any numeric ones added later
+        job_data_json = orjson.dumps(job_data, option=orjson.OPT_INDENT_2, default=decimal_default)
         
-        with open(f"{output_dir}/MVP_SPECS.md", "w") as f:
-            f.write(mvp_specs)
-            
-        with open(f"{output_dir}/DEVELOPMENT_INSTRUCTIONS.md", "w") as f:
-            f.write(dev_instructions)
+        # Environment variables for bash script, quoted so names with quotes
+        # or other shell metacharacters source cleanly
+        env_pairs = [
+            ("BUSINESS_NAME", business_name),
+            ("REPO_NAME", repo_name),
+            ("PRODUCT_DESCRIPTION", f"Modern web application for {business_name}"),
+            ("USER_EMAIL", f"user@{sanitized_name}.com"),
+            ("SANITIZED_NAME", sanitized_name),
+            ("USER_ID", user_id),
+            ("PRODUCT_ID", product_id)
+        ]
+        job_env = "#!/bin/bash\n" + "\n".join(f"export {key}={shlex.quote(str(value))}" for key, value in env_pairs) + "\n"
         
-        # Write complete job data
-        with open(f"{output_dir}/job-data.json", "w") as f:
-            json.dump(dict(job_data), f, indent=2, default=str)
+        # Write files for Claude Code
+        output_files = [
+            (f"{output_dir}/MVP_SPECS.md", mvp_specs.encode(), 0o644),
+            (f"{output_dir}/DEVELOPMENT_INSTRUCTIONS.md", dev_instructions.encode(), 0o644),
+            (f"{output_dir}/job-data.json", job_data_json, 0o644),
+            (f"{output_dir}/job-env.sh", job_env.encode(), 0o755)
+        ]
         
-        # Create environment variables for bash script
-        with open(f"{output_dir}/job-env.sh", "w") as f:
-            f.write(f"""#!/bin/bash
-export BUSINESS_NAME="{business_name}"
-export REPO_NAME="{repo_name}"
-export PRODUCT_DESCRIPTION="Modern web application for {business_name}"
-export USER_EMAIL="user@{sanitized_name}.com"
-export SANITIZED_NAME="{sanitized_name}"
-export USER_ID="{user_id}"
-export PRODUCT_ID="{product_id}"
-""")
+        # The files are independent, so write them concurrently; four workers
+        # keeps at most one open descriptor per file
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda output_file: write_file(*output_file), output_files))
         
         print(f"✅ Job data fetched successfully for {business_name}")
         
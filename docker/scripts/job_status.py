@@ -0,0 +1,9 @@
+"""Importable handle on update-job-status.py, whose hyphenated name can't be imported directly"""
+import importlib.util
+import os
+
+_spec = importlib.util.spec_from_file_location(
+    "update_job_status", os.path.join(os.path.dirname(os.path.abspath(__file__)), "update-job-status.py")
+)
+update_job_status = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(update_job_status)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+import json
+import os
+import signal
+import socketserver
+import sys
+from job_status import update_job_status
+
+# Created once per container so every status update reuses the same
+# session, signer and keep-alive connection to DynamoDB. Handlers run on
+# separate threads, so they go through the thread-safe client rather than
+# the resource, which isn't.
+table = update_job_status.get_table()
+client = table.meta.client
+
+class StatusUpdateHandler(socketserver.StreamRequestHandler):
+    """Apply newline-delimited JSON status updates sent by update-job-status.py"""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            try:
+                update = json.loads(line)
+                update_kwargs = update_job_status.build_update_kwargs(**update)
+
+                if update_kwargs:
+                    client.update_item(TableName=table.name, **update_kwargs)
+                    print(update_job_status.describe_update(update_kwargs), flush=True)
+                else:
+                    print("no-op update skipped", flush=True)
+
+                response = {'ok': True}
+            except Exception as e:
+                print(f"❌ Error updating job status: {str(e)}", flush=True)
+                response = {'ok': False, 'error': str(e)}
+
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+
+if __name__ == "__main__":
+    socket_path = update_job_status.STATUS_DAEMON_SOCKET
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    # Exit through the finally block below so the socket is removed on stop
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    with socketserver.ThreadingUnixStreamServer(socket_path, StatusUpdateHandler) as server:
+        print(f"Status daemon listening on {socket_path}", flush=True)
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(socket_path)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import json
+import os
+import signal
+from job_status import update_job_status
+
+DEFAULT_FIFO_PATH = "/tmp/status.fifo"
+MAX_BATCH_SIZE = 10
+MAX_BATCH_DELAY = 0.25
+
+async def read_batch(reader, stopping):
+    """Collect up to MAX_BATCH_SIZE events, or whatever arrives within MAX_BATCH_DELAY of the first"""
+
+    loop = asyncio.get_running_loop()
+    batch = []
+    deadline = None
+
+    while len(batch) < MAX_BATCH_SIZE:
+        # Poll so a stop request is noticed even while the FIFO is idle
+        timeout = MAX_BATCH_DELAY if deadline is None else deadline - loop.time()
+        if timeout <= 0:
+            break
+
+        try:
+            line = await asyncio.wait_for(reader.readline(), timeout)
+        except asyncio.TimeoutError:
+            if batch or stopping.is_set():
+                break
+            continue
+
+        if not line.strip():
+            continue
+
+        try:
+            batch.append(json.loads(line))
+        except json.JSONDecodeError as e:
+            print(f"❌ Ignoring malformed status event {line!r}: {str(e)}", flush=True)
+            continue
+
+        if deadline is None:
+            deadline = loop.time() + MAX_BATCH_DELAY
+
+    return batch
+
+async def flush_batch(table, job_id, batch):
+    """Write a batch of status events, in order per job and concurrently across jobs"""
+
+    events_by_job = {}
+    for event in batch:
+        event = dict(event)
+        events_by_job.setdefault(event.pop('job_id', job_id), []).append(event)
+
+    async def apply(event_job_id, events):
+        # A failing event is logged and skipped; later events still apply
+        for event in events:
+            try:
+                update_kwargs = update_job_status.build_update_kwargs(event_job_id, **event)
+
+                if not update_kwargs:
+                    print("no-op update skipped", flush=True)
+                    continue
+
+                await table.update_item(**update_kwargs)
+                print(update_job_status.describe_update(update_kwargs), flush=True)
+            except Exception as e:
+                print(f"❌ Error updating job status: {str(e)}", flush=True)
+
+    results = await asyncio.gather(
+        *(apply(event_job_id, events) for event_job_id, events in events_by_job.items()),
+        return_exceptions=True
+    )
+
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"❌ Error updating job status: {str(result)}", flush=True)
+
+async def run(job_id, fifo_path):
+    """Apply newline-delimited JSON status events written to fifo_path until SIGTERM"""
+
+    import aioboto3
+
+    table_name = update_job_status.require_table_name()
+
+    if not os.path.exists(fifo_path):
+        os.mkfifo(fifo_path)
+
+    loop = asyncio.get_running_loop()
+    stopping = asyncio.Event()
+    loop.add_signal_handler(signal.SIGTERM, stopping.set)
+
+    # Opened read-write so the pipe never reports EOF between writers
+    reader = asyncio.StreamReader()
+    fifo = os.fdopen(os.open(fifo_path, os.O_RDWR | os.O_NONBLOCK), 'rb', buffering=0)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), fifo)
+
+    session = aioboto3.Session()
+    try:
+        async with session.resource('dynamodb') as dynamodb:
+            table = await dynamodb.Table(table_name)
+            print(f"Status emitter reading from {fifo_path}", flush=True)
+
+            # Keep draining after SIGTERM until the FIFO has nothing left
+            while True:
+                batch = await read_batch(reader, stopping)
+                if batch:
+                    await flush_batch(table, job_id, batch)
+                elif stopping.is_set():
+                    break
+    finally:
+        os.unlink(fifo_path)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--job-id", required=True)
+    parser.add_argument("--fifo", default=os.environ.get('STATUS_FIFO', DEFAULT_FIFO_PATH))
+
+    args = parser.parse_args()
+    asyncio.run(run(args.job_id, args.fifo))
@@ -0,0 +1,20 @@
+#!/bin/bash
+
+# Shared job status helpers, sourced by pipeline.sh and the stage scripts
+
+STATUS_LIB_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+# Queue a JSON progress update with the pipeline's status emitter, e.g.
+# emit_status '{"step":"X","progress":10}'
+emit_status() {
+    local update="$1"
+    
+    # Only write to the FIFO while the emitter is alive to read it
+    if [ -n "${STATUS_EMITTER_PID:-}" ] && kill -0 "$STATUS_EMITTER_PID" 2>/dev/null && [ -p "${STATUS_FIFO:-}" ]; then
+        echo "$update" > "$STATUS_FIFO"
+    else
+        python3 "$STATUS_LIB_DIR/update-job-status.py" \
+            --job-id "$JOB_ID" \
+            --updates-json "[$update]"
+    fi
+}
@@ -1,16 +1,72 @@
 #!/usr/bin/env python3
-import boto3
 import json
 import argparse
 import os
+import socket
 from datetime import datetime
 
-def update_job_status(job_id, status=None, step=None, progress=None, repo_url=None, repo_name=None, staging_url=None, production_url=None, error=None):
-    """Update job status in DynamoDB"""
+DEFAULT_SOCKET_PATH = "/tmp/status-daemon.sock"
+
+# Environment configuration, resolved once per process
+TABLE_NAME = os.environ.get('DYNAMODB_TABLE')
+STATUS_DAEMON_SOCKET = os.environ.get('STATUS_DAEMON_SOCKET', DEFAULT_SOCKET_PATH)
+
+# Optional update fields: (argument, update expression, reserved attribute
+# name, value type). Each value is bound to the ":<argument>" placeholder, and
+# every field is also exposed as a --<argument> CLI flag.
+FIELDS = [
+    ('status', '#status = :status', 'status', str),
+    ('step', 'currentStep = :step', None, str),
+    ('progress', 'progress = :progress', None, int),
+    ('repo_url', 'githubRepo = :repo_url', None, str),
+    ('repo_name', 'repoName = :repo_name', None, str),
+    ('staging_url', 'stagingUrl = :staging_url', None, str),
+    ('production_url', 'vercelUrl = :production_url', None, str)
+]
+FIELD_NAMES = {field[0] for field in FIELDS}
+
+# Created on first use; boto3 is imported lazily so handing an update to the
+# status daemon doesn't pay for it
+_table = None
+
+def require_table_name():
+    """Return DYNAMODB_TABLE, failing clearly when it isn't set"""
     
-    dynamodb = boto3.resource('dynamodb')
-    table = dynamodb.Table(os.environ['DYNAMODB_TABLE'])
-    print("table: ", table)
+    if not TABLE_NAME:
+        raise Exception("DYNAMODB_TABLE environment variable is required")
+    
+    return TABLE_NAME
+
+def get_table():
+    """Return the process-wide DynamoDB jobs Table"""
+    
+    global _table
+    if _table is None:
+        table_name = require_table_name()
+        
+        import boto3
+        import botocore.config
+        
+        dynamodb = boto3.resource(
+            'dynamodb',
+            config=botocore.config.Config(max_pool_connections=32, tcp_keepalive=True)
+        )
+        _table = dynamodb.Table(table_name)
+    
+    return _table
+
+def build_update_kwargs(job_id, error=None, **fields):
+    """Build the update_item arguments for a job status update
+    
+    fields are the optional FIELDS values, keyed by argument name.
+    """
+    
+    unknown_fields = set(fields) - FIELD_NAMES
+    if unknown_fields:
+        raise TypeError(f"Unknown update field(s): {', '.join(sorted(unknown_fields))}")
+    
+    # One timestamp for every field written by this update
+    now_iso = datetime.utcnow().isoformat()
     
     update_expression_parts = []
     expression_attribute_values = {}
@@ -18,93 +74,197 @@ def update_job_status(job_id, status=None, step=None, progress=None, repo_url=No
     
     # Always update the updatedAt timestamp
     update_expression_parts.append("updatedAt = :updated_at")
-    expression_attribute_values[":updated_at"] = datetime.utcnow().isoformat()
+    expression_attribute_values[":updated_at"] = now_iso
     
-    if status:
-        update_expression_parts.append("#status = :status")
-        expression_attribute_names["#status"] = "status"
-        expression_attribute_values[":status"] = status
-        
-        if status == "IN_PROGRESS":
-            update_expression_parts.append("startedAt = :started_at")
-            expression_attribute_values[":started_at"] = datetime.utcnow().isoformat()
-        elif status == "COMPLETED":
-            update_expression_parts.append("completedAt = :completed_at")
-            expression_attribute_values[":completed_at"] = datetime.utcnow().isoformat()
-    
-    if step:
-        update_expression_parts.append("currentStep = :step")
-        expression_attribute_values[":step"] = step
-    
-    if progress is not None:
-        update_expression_parts.append("progress = :progress")
-        expression_attribute_values[":progress"] = int(progress)
-    
-    if repo_url:
-        update_expression_parts.append("githubRepo = :repo_url")
-        expression_attribute_values[":repo_url"] = repo_url
-    
-    if repo_name:
-        update_expression_parts.append("repoName = :repo_name")
-        expression_attribute_values[":repo_name"] = repo_name
-    
-    if staging_url:
-        update_expression_parts.append("stagingUrl = :staging_url")
-        expression_attribute_values[":staging_url"] = staging_url
+    for argument, expression, attribute_name, value_type in FIELDS:
+        value = fields.get(argument)
+        if value is None or value == '':
+            continue
         
-    if production_url:
-        update_expression_parts.append("vercelUrl = :production_url")
-        expression_attribute_values[":production_url"] = production_url
+        update_expression_parts.append(expression)
+        expression_attribute_values[f":{argument}"] = value_type(value)
+        if attribute_name:
+            expression_attribute_names[f"#{attribute_name}"] = attribute_name
+    
+    status = fields.get('status')
+    if status == "IN_PROGRESS":
+        update_expression_parts.append("startedAt = :started_at")
+        expression_attribute_values[":started_at"] = now_iso
+    elif status == "COMPLETED":
+        update_expression_parts.append("completedAt = :completed_at")
+        expression_attribute_values[":completed_at"] = now_iso
     
     # Add error information if provided
     if error:
         # For flat structure, store error as a simple string or JSON
         error_info = json.dumps({
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': now_iso,
             'message': error,
-            'step': step or 'unknown'
+            'step': fields.get('step') or 'unknown'
         })
         update_expression_parts.append("lastError = :error_info")
         expression_attribute_values[":error_info"] = error_info
     
-    if update_expression_parts:
-        try:
-            update_kwargs = {
-                'Key': {'jobId': job_id},
-                'UpdateExpression': 'SET ' + ', '.join(update_expression_parts),
-                'ExpressionAttributeValues': expression_attribute_values
-            }
+    # Nothing but the updatedAt timestamp means the caller set no fields
+    if len(update_expression_parts) == 1:
+        return None
+    
+    update_kwargs = {
+        'Key': {'jobId': job_id},
+        'UpdateExpression': 'SET ' + ', '.join(update_expression_parts),
+        'ExpressionAttributeValues': expression_attribute_values
+    }
+    
+    if expression_attribute_names:
+        update_kwargs['ExpressionAttributeNames'] = expression_attribute_names
+    
+    return update_kwargs
+
+def describe_update(update_kwargs):
+    """Format the log line for an applied update"""
+    
+    values = ', '.join([f'{k}={v}' for k, v in update_kwargs['ExpressionAttributeValues'].items()])
+    return f"✅ Updated job {update_kwargs['Key']['jobId']}: {values}"
+
+def update_job_status(job_id, error=None, **fields):
+    """Update job status in DynamoDB"""
+    
+    update_kwargs = build_update_kwargs(job_id, error, **fields)
+    
+    if not update_kwargs:
+        print("no-op update skipped")
+        return
+    
+    table = get_table()
+    print("table: ", table)
+    
+    try:
+        table.update_item(**update_kwargs)
+        print(describe_update(update_kwargs))
+    except Exception as e:
+        print(f"❌ Error updating job status: {str(e)}")
+        raise
+
+async def update_job_statuses(job_id, updates):
+    """Apply several job status updates in one process
+    
+    Each update is a dict of update_job_status keyword arguments; an update
+    may carry its own "job_id", otherwise job_id is used. Updates for the same
+    job are applied in order, different jobs concurrently.
+    """
+    
+    import asyncio
+    import aioboto3
+    
+    table_name = require_table_name()
+    
+    updates_by_job = {}
+    for update in updates:
+        update = dict(update)
+        updates_by_job.setdefault(update.pop('job_id', job_id), []).append(update)
+    
+    session = aioboto3.Session()
+    async with session.resource('dynamodb') as dynamodb:
+        table = await dynamodb.Table(table_name)
+        
+        async def apply(update_job_id, job_updates):
+            errors = []
+            for update in job_updates:
+                try:
+                    update_kwargs = build_update_kwargs(update_job_id, **update)
+                    
+                    if not update_kwargs:
+                        print("no-op update skipped")
+                        continue
+                    
+                    await table.update_item(**update_kwargs)
+                    print(describe_update(update_kwargs))
+                except Exception as e:
+                    print(f"❌ Error updating job status: {str(e)}")
+                    errors.append(e)
             
-            if expression_attribute_names:
-                update_kwargs['ExpressionAttributeNames'] = expression_attribute_names
-                
-            table.update_item(**update_kwargs)
-            print(f"✅ Updated job {job_id}: {', '.join([f'{k}={v}' for k, v in expression_attribute_values.items()])}")
-        except Exception as e:
-            print(f"❌ Error updating job status: {str(e)}")
-            raise
+            return errors
+        
+        results = await asyncio.gather(
+            *(apply(update_job_id, job_updates) for update_job_id, job_updates in updates_by_job.items()),
+            return_exceptions=True
+        )
+    
+    errors = []
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"❌ Error updating job status: {str(result)}")
+            errors.append(result)
+        else:
+            errors.extend(result)
+    
+    if errors:
+        raise errors[0]
+
+def send_to_daemon(update):
+    """Hand an update to status-daemon.py, returning False if it isn't running"""
+    
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(STATUS_DAEMON_SOCKET)
+            sock.sendall(json.dumps(update).encode() + b"\n")
+            response_line = sock.makefile('rb').readline()
+    except (FileNotFoundError, ConnectionRefusedError, ConnectionResetError, BrokenPipeError):
+        return False
+    
+    # The daemon went away before answering
+    if not response_line.strip():
+        return False
+    
+    response = json.loads(response_line)
+    
+    if not response['ok']:
+        print(f"❌ Error updating job status: {response['error']}")
+        raise Exception(response['error'])
+    
+    return True
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--job-id", required=True)
-    parser.add_argument("--status")
-    parser.add_argument("--step") 
-    parser.add_argument("--progress", type=int)
-    parser.add_argument("--repo-url")
-    parser.add_argument("--repo-name")
-    parser.add_argument("--staging-url")
-    parser.add_argument("--production-url")
+    for argument, _, _, value_type in FIELDS:
+        parser.add_argument(f"--{argument.replace('_', '-')}", type=value_type)
     parser.add_argument("--error")
+    parser.add_argument("--updates-json", help="JSON array of updates (update_job_status keyword arguments) to apply in one process")
     
     args = parser.parse_args()
-    update_job_status(
-        args.job_id,
-        args.status,
-        args.step,
-        args.progress,
-        args.repo_url,
-        args.repo_name,
-        args.staging_url,
-        args.production_url,
-        args.error
-    )
\ No newline at end of file
+    
+    if args.updates_json:
+        updates = json.loads(args.updates_json)
+        errors = []
+        
+        # Hand the updates to the daemon in order while it's running; only
+        # the ones it can't take need aioboto3
+        remaining = []
+        for index, update in enumerate(updates):
+            try:
+                if not send_to_daemon({'job_id': args.job_id, **update}):
+                    remaining = updates[index:]
+                    break
+            except Exception as e:
+                errors.append(e)
+        
+        if remaining:
+            import asyncio
+            
+            try:
+                asyncio.run(update_job_statuses(args.job_id, remaining))
+            except Exception as e:
+                errors.append(e)
+        
+        if errors:
+            raise errors[0]
+    else:
+        update = {argument: getattr(args, argument) for argument in FIELD_NAMES}
+        update['job_id'] = args.job_id
+        update['error'] = args.error
+        
+        # Prefer the long-lived daemon, which already has boto3 loaded and a
+        # warm DynamoDB connection; fall back to a direct update without it
+        if not send_to_daemon(update):
+            update_job_status(**update)
\ No newline at end of file
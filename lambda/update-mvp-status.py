@@ -1,11 +1,20 @@
 import json
 import boto3
+import botocore.config
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
 
-# Initialize AWS clients
-dynamodb = boto3.resource('dynamodb')
+# Initialize AWS clients once per container so warm invocations reuse the
+# session, signer and pooled keep-alive connections to DynamoDB
+session = boto3.session.Session()
+dynamodb_config = botocore.config.Config(
+    max_pool_connections=32,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    tcp_keepalive=True
+)
+dynamodb = session.resource('dynamodb', config=dynamodb_config)
 jobs_table = dynamodb.Table(os.environ['DYNAMODB_TABLE'])
 status_table = dynamodb.Table(os.environ['STATUS_TABLE'])
 
@@ -20,25 +29,43 @@ def lambda_handler(event, context):
     Process SNS messages from MVP development completion
     """
     try:
-        # Parse SNS message
+        # Parse SNS messages
+        messages = []
         for record in event['Records']:
             if record['EventSource'] == 'aws:sns':
                 message = json.loads(record['Sns']['Message'])
                 
-                job_id = message.get('jobId')
-                status = message.get('status', 'completed')
-                
-                if not job_id:
+                if not message.get('jobId'):
                     print(f"No jobId found in message: {message}")
                     continue
                 
-                # Update main jobs table
-                update_job_record(job_id, message)
-                
-                # Update status table for quick queries
-                update_status_record(message)
-                
-                print(f"Successfully updated status for job {job_id}")
+                messages.append(message)
+        
+        # Records are independent per job, so fan the job updates out
+        # across threads; a single record is processed inline
+        if len(messages) > 1:
+            with ThreadPoolExecutor(max_workers=min(16, len(messages))) as executor:
+                errors = list(executor.map(process_message_safely, messages))
+        else:
+            errors = [process_message_safely(message) for message in messages]
+        
+        # Only jobs whose record was updated get a status record
+        updated_messages = [message for message, error in zip(messages, errors) if error is None]
+        
+        # Update status table for quick queries; UpdateItem has no batch API
+        # but the status puts do, so they go out as ceil(N/25) requests
+        status_records = [record for record in map(build_status_record, updated_messages) if record]
+        if status_records:
+            with status_table.batch_writer(overwrite_by_pkeys=['projectId']) as batch:
+                for status_record in status_records:
+                    batch.put_item(Item=status_record)
+        
+        for message in updated_messages:
+            print(f"Successfully updated status for job {message['jobId']}")
+        
+        failures = [error for error in errors if error is not None]
+        if failures:
+            raise failures[0]
         
         return {
             'statusCode': 200,
@@ -52,8 +79,28 @@ def lambda_handler(event, context):
             'body': json.dumps(f'Error: {str(e)}')
         }
 
-def update_job_record(job_id, message):
-    """Update the main job record in DynamoDB"""
+def process_message(message):
+    """Update the main job record for a single SNS status message"""
+    
+    # Runs on worker threads: resource objects aren't thread-safe but their
+    # client is, and it applies the same Python-to-DynamoDB type conversion
+    jobs_table.meta.client.update_item(TableName=jobs_table.name, **build_job_update(message['jobId'], message))
+
+def process_message_safely(message):
+    """Run process_message, returning None on success or the exception raised"""
+    
+    try:
+        process_message(message)
+    except Exception as e:
+        print(f"Error updating job {message['jobId']}: {str(e)}")
+        return e
+    
+    return None
+
+def build_job_update(job_id, message):
+    """Build the update for the main job record in DynamoDB"""
+    
+    now_iso = datetime.utcnow().isoformat()
     
     update_expression_parts = []
     expression_attribute_values = {}
@@ -65,7 +112,7 @@ def update_job_record(job_id, message):
     update_expression_parts.append("timestamps.completedAt = :completed_at")
     expression_attribute_names["#status"] = "status"
     expression_attribute_values[":status"] = status
-    expression_attribute_values[":completed_at"] = datetime.utcnow().isoformat()
+    expression_attribute_values[":completed_at"] = now_iso
     
     # Update progress to 100% if completed
     if status == 'completed':
@@ -105,22 +152,22 @@ def update_job_record(job_id, message):
         update_expression_parts.append("errors = list_append(if_not_exists(errors, :empty_list), :error)")
         expression_attribute_values[":empty_list"] = []
         expression_attribute_values[":error"] = [{
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': now_iso,
             'message': message['error'],
             'step': message.get('currentStep', 'unknown')
         }]
     
-    # Execute update
-    if update_expression_parts:
-        jobs_table.update_item(
-            Key={'jobId': job_id},
-            UpdateExpression='SET ' + ', '.join(update_expression_parts),
-            ExpressionAttributeNames=expression_attribute_names,
-            ExpressionAttributeValues=expression_attribute_values
-        )
+    return {
+        'Key': {'jobId': job_id},
+        'UpdateExpression': 'SET ' + ', '.join(update_expression_parts),
+        'ExpressionAttributeNames': expression_attribute_names,
+        'ExpressionAttributeValues': expression_attribute_values
+    }
 
-def update_status_record(message):
-    """Update the status table for quick queries"""
+def build_status_record(message):
+    """Build the status table record for quick queries"""
+    
+    now = datetime.utcnow()
     
     job_id = message.get('jobId')
     project_id = message.get('projectId', job_id)  # Use jobId as fallback
@@ -128,13 +175,13 @@ def update_status_record(message):
     
     if not all([job_id, project_id]):
         print(f"Missing required fields for status update: jobId={job_id}, projectId={project_id}")
-        return
+        return None
     
     status_record = {
         'projectId': project_id,
         'jobId': job_id,
         'status': message.get('status', 'completed'),
-        'updatedAt': datetime.utcnow().isoformat(),
+        'updatedAt': now.isoformat(),
         'urls': {
             'production': message.get('productionUrl'),
             'staging': message.get('stagingUrl'),
@@ -151,8 +198,7 @@ def update_status_record(message):
         status_record['businessName'] = message['businessName']
     
     # Add TTL for automatic cleanup (30 days)
-    ttl_timestamp = int(datetime.utcnow().timestamp()) + (30 * 24 * 60 * 60)
+    ttl_timestamp = int(now.timestamp()) + (30 * 24 * 60 * 60)
     status_record['ttl'] = ttl_timestamp
     
-    # Put item in status table
-    status_table.put_item(Item=status_record)
\ No newline at end of file
+    return status_record
\ No newline at end of file